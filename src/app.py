@@ -4,9 +4,13 @@ import web
 
 from config import routes, environment
 from vendor import mvc
+from vendor.mvc.server import PreforkServer
 
-app = mvc.application(routes.urls, {}, autoreload=True)
+app = mvc.application(routes.urls, {}, autoreload=web.config.debug).load_controllers().load_templates()
 env = web.config.get('env')
 
 if __name__ == '__main__':
-    app.run()
+    if env == 'production':
+        PreforkServer(app, **web.config.server).run()
+    else:
+        app.run()
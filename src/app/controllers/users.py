@@ -4,10 +4,17 @@ from app.controllers.application import ApplicationController
 from app.models.user import UserDao, UserForm
 
 class UsersController(ApplicationController):
+    cache = {'index': 60, 'show': 60}
+    per_page = 20
 
-    def index(self, page=1):
-        users = UserDao.all()
-        return self.render(users=users)
+    def index(self, page=None):
+        page = page or web.input(page=None).page
+        users = UserDao.page(after=page, limit=self.per_page)
+        next = users[-1].id if len(users) == self.per_page else None
+        return self.render(users=users, next=next)
+
+    def all(self):
+        return self.stream(UserDao.iterate())
 
     def new(self):
         form = UserForm.get('new')
@@ -22,6 +29,8 @@ class UsersController(ApplicationController):
     
     def show(self, id):
         user = UserDao.find(id)
+        if user is None:
+            raise web.notfound()
         return self.render(user=user)
     
     def delete(self, id):
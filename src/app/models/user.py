@@ -1,29 +1,21 @@
 import web
 from web import form
+from vendor.mvc.model import Dao, ModelCache
 
 class User(object):
 
     class Meta:
         table = 'user'
-        fields = ['id', 'name']
+        fields = ['id', 'email', 'username', 'name', 'gender', 'created_at', 'updated_at']
 
     def __init__(self, data=None, **kwargs):
         data = data or kwargs
         for field in self.Meta.fields:
             self.__dict__[field] = data.get(field, None)
 
-class UserDao(object):
-    @classmethod
-    def find(cls, id):
-        return User({'id': id, 'name': 'User %s' % id})
-
-    @classmethod
-    def all(cls):
-        return [
-            User({'id': 1, 'name': 'User 1'}),
-            User({'id': 2, 'name': 'User 2'}),
-            User({'id': 3, 'name': 'User 3'})
-        ]
+class UserDao(Dao):
+    model = User
+    cache = ModelCache('user', size=1000, ttl=60)
 
 class UserForm(object):
     
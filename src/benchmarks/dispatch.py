@@ -0,0 +1,86 @@
+# Dispatch benchmark: requests per second through app.request() for a bare
+# action, an action with route params and an action rendering a template,
+# the mean time spent in each stage of the request, and the cost of
+# controller attribute access. Each figure is the median of REPEAT runs.
+# Run from the src directory:
+#
+#     $ python -m benchmarks.dispatch
+
+import time, timeit
+import web
+
+from vendor import mvc
+from vendor.mvc.metrics import Metrics
+from app.controllers.application import ApplicationController
+
+REQUESTS = 2000
+REPEAT = 5
+
+urls = (
+    '/hello',      {'controller':'bench', 'action':'hello'},
+    '/user/(\d+)', {'controller':'bench', 'action':'show', 'id':'{0}'},
+    '/page',       {'controller':'bench', 'action':'page'},
+)
+
+
+class BenchController(ApplicationController):
+
+    def hello(self):
+        return 'hello'
+
+    def show(self, id):
+        self.id = id
+        return 'user %s' % self.id
+
+    def page(self):
+        return self.render('errors/404')
+
+
+def median(values):
+    return sorted(values)[len(values) / 2]
+
+
+def requests_per_second(app, path):
+    runs = []
+    for i in range(REPEAT):
+        start = time.time()
+        for j in xrange(REQUESTS):
+            app.request(path)
+        runs.append(REQUESTS / (time.time() - start))
+    return median(runs)
+
+
+def stages(app, path):
+    app.metrics = Metrics(enabled=True)
+    app.add_processor(app.metrics.processor)
+    for j in xrange(REQUESTS):
+        app.request(path)
+    app.processors.remove(app.metrics.processor)
+    return dict((key[2], h.sum / h.count * 1e6) for key, h in app.metrics.stages.items())
+
+
+def attributes():
+    web.ctx.clear()
+    controller = BenchController({'controller': 'bench', 'action': 'hello'})
+    def access():
+        controller.title = 'title'
+        controller.title
+        controller.params
+    return median(timeit.repeat(access, number=100000, repeat=REPEAT)) / 100000 * 1e9
+
+
+def main():
+    app = mvc.application(urls, globals()).load_templates()
+    names = ('route', 'resolve', 'initialize', 'action', 'render')
+    print '%-10s %10s %s' % ('path', 'req/s', ' '.join('%10s' % ('%s us' % n[:6]) for n in names))
+    for path in ('/hello', '/user/7', '/page'):
+        rps = requests_per_second(app, path)
+        timings = stages(app, path)
+        print '%-10s %10.0f %s' % (path, rps, ' '.join('%10.1f' % timings.get(n, 0) for n in names))
+    print
+    print 'controller attribute set/get: %.0f ns' % attributes()
+
+
+if __name__ == '__main__':
+    web.config.debug = False
+    main()
@@ -0,0 +1,38 @@
+# Data access benchmark: N lookups with find() against one find_many() batch,
+# on a copy of db/example.sqlite, with the model cache disabled. Run from the
+# src directory:
+#
+#     $ python -m benchmarks.models
+
+import os, shutil, tempfile, timeit
+
+from vendor.mvc.model import ConnectionPool
+from app.models.user import User, UserDao
+
+ROWS = 5000
+LOOKUPS = (10, 100, 1000)
+
+
+def setup():
+    path = os.path.join(tempfile.mkdtemp(), 'example.sqlite')
+    shutil.copy(os.path.join('db', 'example.sqlite'), path)
+    UserDao.pool = ConnectionPool(dbn='sqlite', db=path)
+    UserDao.cache = None
+    for i in range(ROWS):
+        UserDao.save(User(name='User %d' % i))
+    return path
+
+
+def main():
+    path = setup()
+    print '%8s %14s %16s' % ('lookups', 'find (ms)', 'find_many (ms)')
+    for n in LOOKUPS:
+        ids = range(1, n + 1)
+        single = timeit.timeit(lambda: [UserDao.find(id) for id in ids], number=5) / 5
+        batch = timeit.timeit(lambda: UserDao.find_many(ids), number=5) / 5
+        print '%8d %14.2f %16.2f' % (n, single * 1e3, batch * 1e3)
+    shutil.rmtree(os.path.dirname(path))
+
+
+if __name__ == '__main__':
+    main()
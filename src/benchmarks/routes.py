@@ -0,0 +1,38 @@
+# Route matching benchmark: compares the compiled Router against web.py's
+# linear scan as the route table grows. All the routes share the /api prefix,
+# and the path matched is the last route. Run from the src directory:
+#
+#     $ python -m benchmarks.routes
+
+import timeit
+import web
+
+from vendor.mvc.router import Router
+
+SIZES = (10, 100, 1000, 5000)
+NUMBER = 2000
+
+
+def mapping(size):
+    urls = []
+    for i in range(size / 2):
+        urls.append(('/api/resource%d/(\d+)' % i, {'controller':'resource%d' % i, 'action':'show', 'id':'{0}'}))
+        urls.append(('/api/resource%d' % i,       {'controller':'resource%d' % i, 'action':'index'}))
+    return urls
+
+
+def main():
+    app = web.application()
+    print '%8s %14s %14s' % ('routes', 'linear (us)', 'compiled (us)')
+    for size in SIZES:
+        urls = mapping(size)
+        router = Router(urls)
+        path = '/api/resource%d/42' % (size / 2 - 1)
+        assert router.match(path)[0].target == app._match(urls, path)[0]
+        linear = timeit.timeit(lambda: app._match(urls, path), number=NUMBER)
+        compiled = timeit.timeit(lambda: router.match(path), number=NUMBER)
+        print '%8d %14.2f %14.2f' % (size, linear / NUMBER * 1e6, compiled / NUMBER * 1e6)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,69 @@
+# Streaming benchmark: renders every user of a large copy of
+# db/example.sqlite as one string, then as a stream, each in its own process,
+# and reports the peak RSS and the time to first byte. Run from the src
+# directory:
+#
+#     $ python -m benchmarks.streaming
+
+import os, sys, time, shutil, sqlite3, resource, subprocess, tempfile
+import web
+
+from vendor import mvc
+from app.controllers.application import ApplicationController
+from vendor.mvc.model import ConnectionPool
+from app.models.user import UserDao
+
+ROWS = 50000
+
+
+class UsersController(ApplicationController):
+
+    def buffered(self):
+        return self.render('users/index', users=UserDao.all())
+
+    def streamed(self):
+        return self.stream(UserDao.iterate(), 'users/all')
+
+
+def setup():
+    path = os.path.join(tempfile.mkdtemp(), 'example.sqlite')
+    shutil.copy(os.path.join('db', 'example.sqlite'), path)
+    db = sqlite3.connect(path)
+    db.executemany("INSERT INTO user (name, created_at, updated_at) VALUES (?, datetime('now'), datetime('now'))",
+                   (('User %d' % i,) for i in xrange(ROWS)))
+    db.commit()
+    db.close()
+    return path
+
+
+def measure(action, path):
+    UserDao.pool = ConnectionPool(dbn='sqlite', db=path)
+    urls = ('/users/(buffered|streamed)', {'controller':'users', 'action':'{0}'})
+    app = mvc.application(urls, globals()).load_templates()
+    env = {'REQUEST_METHOD': 'GET', 'PATH_INFO': '/users/' + action, 'wsgi.input': sys.stdin,
+           'SERVER_NAME': 'localhost', 'SERVER_PORT': '80', 'wsgi.url_scheme': 'http'}
+    start = time.time()
+    chunks = iter(app.wsgifunc()(env, lambda status, headers: None))
+    size = len(next(chunks))
+    ttfb = time.time() - start
+    for chunk in chunks:
+        size += len(chunk)
+    total = time.time() - start
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024.0
+    print '%10s %12.1f %12.1f %12.1f %12d' % (action, rss, ttfb * 1e3, total * 1e3, size)
+
+
+def main():
+    if len(sys.argv) > 2:
+        return measure(sys.argv[1], sys.argv[2])
+    path = setup()
+    print '%10s %12s %12s %12s %12s' % ('mode', 'rss (MB)', 'ttfb (ms)', 'total (ms)', 'bytes')
+    for action in ('buffered', 'streamed'):
+        sys.stdout.flush()
+        subprocess.call([sys.executable, '-m', 'benchmarks.streaming', action, path])
+    shutil.rmtree(os.path.dirname(path))
+
+
+if __name__ == '__main__':
+    web.config.debug = False
+    main()
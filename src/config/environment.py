@@ -5,3 +5,14 @@ if 'production' == os.environ.get('APP_ENV'):
     import config.environments.production
 else:
     import config.environments.development
+
+# pre-forking server settings, overridden by APP_BIND, APP_WORKERS, APP_THREADS
+# and APP_MAX_REQUESTS
+server = web.config.get('server', {})
+for key in ('bind', 'workers', 'threads', 'max_requests'):
+    value = os.environ.get('APP_' + key.upper())
+    if value:
+        server[key] = value if key == 'bind' else int(value)
+if server.get('workers', 1) < 1:
+    raise ValueError('APP_WORKERS must be at least 1, got %r' % server['workers'])
+web.config.server = server
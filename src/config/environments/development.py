@@ -1,5 +1,7 @@
 import web
 
+from vendor.mvc.model import ConnectionPool
+
 # environment
 web.config.env = 'development'
 
@@ -8,3 +10,9 @@ web.config.debug = True
             
 # database connectio
 web.config.database = web.database(dbn='sqlite', db='db/example.sqlite')
+
+# connection pool used by the data access objects in app/models
+web.config.pool = ConnectionPool(dbn='sqlite', db='db/example.sqlite', size=10)
+
+# request timings per controller, action and status, served in the Prometheus text format
+web.config.metrics = dict(enabled=True, path='/_metrics', sample_rate=1.0, log=False)
@@ -1,5 +1,9 @@
+import os, tempfile, multiprocessing
 import web
 
+from vendor.mvc.cache import FileStore
+from vendor.mvc.model import ConnectionPool
+
 # environment
 web.config.env = 'production'
 
@@ -8,3 +12,17 @@ web.config.debug = False
             
 # required adapter MySQLdb http://sourceforge.net/projects/mysql-python
 web.config.database = web.database(dbn='mysql', user='username', pw='password', db='example')
+
+# connection pool used by the data access objects in app/models
+web.config.pool = ConnectionPool(dbn='mysql', user='username', pw='password', db='example', size=20)
+
+# response cache shared by all the workers, kept in memory on tmpfs, overridden by APP_CACHE_DIR
+shm = os.path.isdir('/dev/shm') and '/dev/shm' or tempfile.gettempdir()
+web.config.cache_store = FileStore(os.environ.get('APP_CACHE_DIR', os.path.join(shm, 'mvc-cache')), size=10000)
+
+# request timings per controller, action and status, served in the Prometheus text format
+# to the scrapers listed in allow only
+web.config.metrics = dict(enabled=True, path='/_metrics', sample_rate=0.1, log=False, allow=('127.0.0.1', '::1'))
+
+# pre-forking server: one worker per core, recycled after max_requests requests
+web.config.server = dict(bind='0.0.0.0:8080', workers=multiprocessing.cpu_count(), threads=10, max_requests=10000)
@@ -5,6 +5,7 @@ urls = (
     '/user/(\d+)/(index|update|delete)', {'controller':'index', 'action':'{1}', 'id':'{0}'},
     '/user/(new|create)',                {'controller':'users', 'action':'{0}'},
     '/user/(\d+)',                       {'controller':'users', 'action':'show', 'id':'{0}'},
+    '/users/all',                        {'controller':'users', 'action':'all'},
     '/users',                            {'controller':'users', 'action':'index'},
     '/',                                 {'controller':'index', 'action':'index'}
 )
\ No newline at end of file